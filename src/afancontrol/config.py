@@ -1,4 +1,5 @@
 import configparser
+import sys
 from pathlib import Path
 from typing import (
     Dict,
@@ -128,7 +129,12 @@ class ParsedConfig(NamedTuple):
 def parse_config(config_path: Path, daemon_cli_config: DaemonCLIConfig) -> ParsedConfig:
     config = configparser.ConfigParser(interpolation=None)
     try:
-        config.read_string(config_path.read_text(), source=str(config_path))
+        # Read the whole file at once and decode it explicitly: the locale
+        # encoding (which `read_text()` uses by default) might be ASCII
+        # under init systems.
+        config.read_string(
+            config_path.read_text(encoding="utf-8"), source=str(config_path)
+        )
     except Exception as e:
         raise RuntimeError("Unable to parse %s:\n%s" % (config_path, e))
 
@@ -292,8 +298,12 @@ def _parse_mappings(
 
         # temps:
 
+        # The names are interned just like the section names they refer to
+        # (see `iter_sections`), so the per-tick lookups by these names
+        # would hit the identity fast path of the str comparison.
         mapping_temps = [
-            TempName(temp_name.strip()) for temp_name in section["temps"].split(",")
+            TempName(sys.intern(temp_name.strip()))
+            for temp_name in section["temps"].split(",")
         ]
         mapping_temps = [s for s in mapping_temps if s]
         if not mapping_temps:
@@ -312,31 +322,23 @@ def _parse_mappings(
 
         # fans:
 
-        fans_with_speed = [
-            fan_with_speed.strip() for fan_with_speed in section["fans"].split(",")
-        ]
-        fans_with_speed = [s for s in fans_with_speed if s]
-
-        fan_speed_pairs = [
-            fan_with_speed.split("*") for fan_with_speed in fans_with_speed
-        ]
-        for fan_speed_pair in fan_speed_pairs:
-            if len(fan_speed_pair) not in (1, 2):
+        mapping_fans = []
+        for fan_with_speed in section["fans"].split(","):
+            fan_with_speed = fan_with_speed.strip()
+            if not fan_with_speed:
+                continue
+            fan_name, sep, modifier = fan_with_speed.partition("*")
+            if "*" in modifier:
                 raise RuntimeError(
                     "Invalid fan specification '%s' in mapping '%s'"
-                    % (fan_speed_pair, section.name)
+                    % (fan_with_speed, section.name)
+                )
+            mapping_fans.append(
+                FanSpeedModifier(
+                    fan=FanName(sys.intern(fan_name.strip())),
+                    modifier=float(modifier) if sep else 1.0,
                 )
-        mapping_fans = [
-            FanSpeedModifier(
-                fan=FanName(fan_speed_pair[0].strip()),
-                modifier=(
-                    float(
-                        fan_speed_pair[1].strip() if len(fan_speed_pair) == 2 else 1.0
-                    )
-                ),
             )
-            for fan_speed_pair in fan_speed_pairs
-        ]
         for fan_speed_modifier in mapping_fans:
             if fan_speed_modifier.fan not in fans:
                 raise RuntimeError(
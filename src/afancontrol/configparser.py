@@ -1,5 +1,6 @@
 import configparser
 import glob
+import sys
 from typing import Any, Generic, Iterator, Optional, Type, TypeVar, Union, overload
 
 T = TypeVar("T", bound=str)
@@ -17,7 +18,9 @@ def iter_sections(
         if section_name_parts[0].strip().lower() != section_type:
             continue
 
-        name = name_typevar(section_name_parts[1].strip())
+        # Section names are used as dict keys on every tick. Interning them
+        # lets equal names from different places compare by identity.
+        name = name_typevar(sys.intern(section_name_parts[1].strip()))
         section = ConfigParserSection(config[section_name], name)
         yield section
 
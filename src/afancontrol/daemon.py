@@ -135,7 +135,11 @@ class PidFile:
         return None
 
     def save_pid(self, pid: int) -> None:
-        self.pidfile.write_text(str(pid))
+        # Write to a temporary file and rename it over the pidfile, so
+        # the readers would never see a partially written pidfile.
+        tmp_pidfile = self.pidfile.with_name(self.pidfile.name + ".tmp")
+        tmp_pidfile.write_text(str(pid))
+        tmp_pidfile.replace(self.pidfile)
 
     def remove(self) -> None:
         self.pidfile.unlink()
@@ -4,7 +4,18 @@ import threading
 from http.server import HTTPServer
 from socketserver import ThreadingMixIn
 from timeit import default_timer
-from typing import ContextManager, Mapping, Optional, Union
+from typing import (
+    ContextManager,
+    Dict,
+    Iterator,
+    List,
+    Mapping,
+    NamedTuple,
+    Optional,
+    Sequence,
+    Tuple,
+    Union,
+)
 
 from afancontrol.arduino import ArduinoConnection, ArduinoName
 from afancontrol.config import TempName
@@ -17,6 +28,7 @@ from afancontrol.trigger import Triggers
 
 try:
     import prometheus_client as prom
+    from prometheus_client.core import GaugeMetricFamily
 
     prometheus_available = True
 except ImportError:
@@ -99,133 +111,12 @@ class PrometheusMetrics(Metrics):
         if hasattr(prom, "GCCollector"):
             prom.GCCollector(registry=self.registry)
 
-        # Temps:
-        self.temperature_is_failing = prom.Gauge(
-            "temperature_is_failing",
-            "The temperature sensor is failing (it isn't returning any data)",
-            ["temp_name"],
-            registry=self.registry,
-        )
-        self.temperature_current = prom.Gauge(
-            "temperature_current",
-            "The current (filtered) temperature value (in Celsius) "
-            "from a temperature sensor",
-            ["temp_name"],
-            registry=self.registry,
-        )
-        self.temperature_min = prom.Gauge(
-            "temperature_min",
-            "The min temperature value (in Celsius) for a temperature sensor",
-            ["temp_name"],
-            registry=self.registry,
-        )
-        self.temperature_max = prom.Gauge(
-            "temperature_max",
-            "The max temperature value (in Celsius) for a temperature sensor",
-            ["temp_name"],
-            registry=self.registry,
-        )
-        self.temperature_panic = prom.Gauge(
-            "temperature_panic",
-            "The panic temperature value (in Celsius) for a temperature sensor",
-            ["temp_name"],
-            registry=self.registry,
-        )
-        self.temperature_threshold = prom.Gauge(
-            "temperature_threshold",
-            "The threshold temperature value (in Celsius) for a temperature sensor",
-            ["temp_name"],
-            registry=self.registry,
-        )
-        self.temperature_is_panic = prom.Gauge(
-            "temperature_is_panic",
-            "Is panic temperature reached for a temperature sensor",
-            ["temp_name"],
-            registry=self.registry,
-        )
-        self.temperature_is_threshold = prom.Gauge(
-            "temperature_is_threshold",
-            "Is threshold temperature reached for a temperature sensor",
-            ["temp_name"],
-            registry=self.registry,
-        )
-
-        self.temperature_current_raw = prom.Gauge(
-            "temperature_current_raw",
-            "The current (unfiltered) temperature value (in Celsius) "
-            "from a temperature sensor",
-            ["temp_name"],
-            registry=self.registry,
-        )
-
-        # Fans:
-        self.fan_rpm = prom.Gauge(
-            "fan_rpm",
-            "Fan speed (in RPM) as reported by the fan",
-            ["fan_name"],
-            registry=self.registry,
-        )
-        self.fan_pwm = prom.Gauge(
-            "fan_pwm",
-            "Current fan's PWM value (from 0 to 255)",
-            ["fan_name"],
-            registry=self.registry,
-        )
-        self.fan_pwm_normalized = prom.Gauge(
-            "fan_pwm_normalized",
-            "Current fan's normalized PWM value (from 0.0 to 1.0, within "
-            "the `fan_pwm_line_start` and `fan_pwm_line_end` interval)",
-            ["fan_name"],
-            registry=self.registry,
-        )
-        self.fan_pwm_line_start = prom.Gauge(
-            "fan_pwm_line_start",
-            "PWM value where a linear correlation with RPM starts for the fan",
-            ["fan_name"],
-            registry=self.registry,
-        )
-        self.fan_pwm_line_end = prom.Gauge(
-            "fan_pwm_line_end",
-            "PWM value where a linear correlation with RPM ends for the fan",
-            ["fan_name"],
-            registry=self.registry,
-        )
-        self.fan_is_stopped = prom.Gauge(
-            "fan_is_stopped",
-            "Is PWM fan stopped because the corresponding temperatures "
-            "are already low",
-            ["fan_name"],
-            registry=self.registry,
-        )
-        self.fan_is_failing = prom.Gauge(
-            "fan_is_failing",
-            "Is PWM fan marked as failing (e.g. because it has jammed)",
-            ["fan_name"],
-            registry=self.registry,
-        )
-
-        # Arduino boards:
-        self.arduino_is_connected = prom.Gauge(
-            "arduino_is_connected",
-            "Is Arduino board connected via Serial",
-            ["arduino_name"],
-            registry=self.registry,
-        )
-        self.arduino_status_age_seconds = prom.Gauge(
-            "arduino_status_age_seconds",
-            "Seconds since the last `status` message from "
-            "the Arduino board (measured at the latest tick)",
-            ["arduino_name"],
-            registry=self.registry,
-        )
-
-        # Others:
-        self.is_panic = prom.Gauge(
-            "is_panic", "Is in panic mode", registry=self.registry
-        )
-        self.is_threshold = prom.Gauge(
-            "is_threshold", "Is in threshold mode", registry=self.registry
-        )
+        # The metrics updated on each tick are exposed by a custom
+        # collector instead of a set of labelled Gauges: each tick builds
+        # a fresh set of metric families which the collector then returns
+        # as is on every scrape until the next tick.
+        self._tick_collector = _TickCollector()
+        self.registry.register(self._tick_collector)
 
         self.tick_duration = prom.Histogram(
             # Summary would have been better there, but prometheus_client
@@ -279,95 +170,109 @@ class PrometheusMetrics(Metrics):
         triggers: Triggers,
         arduino_connections: Mapping[ArduinoName, ArduinoConnection],
     ) -> None:
+        samples = _TickSamples()
+
         for temp_name, observed_temp_status in temps.items():
+            labels = [temp_name]
             temp_status = observed_temp_status.filtered
             if temp_status is None:
-                self.temperature_is_failing.labels(temp_name).set(1)
-                self.temperature_current.labels(temp_name).set(none_to_nan(None))
-                self.temperature_min.labels(temp_name).set(none_to_nan(None))
-                self.temperature_max.labels(temp_name).set(none_to_nan(None))
-                self.temperature_panic.labels(temp_name).set(none_to_nan(None))
-                self.temperature_threshold.labels(temp_name).set(none_to_nan(None))
-                self.temperature_is_panic.labels(temp_name).set(none_to_nan(None))
-                self.temperature_is_threshold.labels(temp_name).set(none_to_nan(None))
+                samples.add("temperature_is_failing", labels, 1)
+                samples.add("temperature_current", labels, none_to_nan(None))
+                samples.add("temperature_min", labels, none_to_nan(None))
+                samples.add("temperature_max", labels, none_to_nan(None))
+                samples.add("temperature_panic", labels, none_to_nan(None))
+                samples.add("temperature_threshold", labels, none_to_nan(None))
+                samples.add("temperature_is_panic", labels, none_to_nan(None))
+                samples.add("temperature_is_threshold", labels, none_to_nan(None))
             else:
-                self.temperature_is_failing.labels(temp_name).set(0)
-                self.temperature_current.labels(temp_name).set(temp_status.temp)
-                self.temperature_min.labels(temp_name).set(temp_status.min)
-                self.temperature_max.labels(temp_name).set(temp_status.max)
-                self.temperature_panic.labels(temp_name).set(
-                    none_to_nan(temp_status.panic)
-                )
-                self.temperature_threshold.labels(temp_name).set(
-                    none_to_nan(temp_status.threshold)
+                samples.add("temperature_is_failing", labels, 0)
+                samples.add("temperature_current", labels, temp_status.temp)
+                samples.add("temperature_min", labels, temp_status.min)
+                samples.add("temperature_max", labels, temp_status.max)
+                samples.add("temperature_panic", labels, none_to_nan(temp_status.panic))
+                samples.add(
+                    "temperature_threshold", labels, none_to_nan(temp_status.threshold)
                 )
-                self.temperature_is_panic.labels(temp_name).set(temp_status.is_panic)
-                self.temperature_is_threshold.labels(temp_name).set(
-                    temp_status.is_threshold
+                samples.add("temperature_is_panic", labels, temp_status.is_panic)
+                samples.add(
+                    "temperature_is_threshold", labels, temp_status.is_threshold
                 )
 
             temp_status = observed_temp_status.raw
             if temp_status is None:
-                self.temperature_current_raw.labels(temp_name).set(none_to_nan(None))
+                samples.add("temperature_current_raw", labels, none_to_nan(None))
             else:
-                self.temperature_current_raw.labels(temp_name).set(temp_status.temp)
+                samples.add("temperature_current_raw", labels, temp_status.temp)
 
         for fan_name, pwmfan_norm in fans.fans.items():
-            self._collect_fan_metrics(fans, fan_name, pwmfan_norm)
+            self._collect_fan_metrics(samples, fans, fan_name, pwmfan_norm)
         for readonly_fan_name, readonly_pwmfan_norm in fans.readonly_fans.items():
             self._collect_readonly_fan_metrics(
-                fans, readonly_fan_name, readonly_pwmfan_norm
+                samples, fans, readonly_fan_name, readonly_pwmfan_norm
             )
 
         for arduino_name, arduino_connection in arduino_connections.items():
-            self.arduino_is_connected.labels(arduino_name).set(
-                arduino_connection.is_connected
+            samples.add(
+                "arduino_is_connected", [arduino_name], arduino_connection.is_connected
             )
-            self.arduino_status_age_seconds.labels(arduino_name).set(
-                arduino_connection.status_age_seconds
+            samples.add(
+                "arduino_status_age_seconds",
+                [arduino_name],
+                arduino_connection.status_age_seconds,
             )
 
-        self.is_panic.set(triggers.panic_trigger.is_alerting)
-        self.is_threshold.set(triggers.threshold_trigger.is_alerting)
+        samples.add("is_panic", [], triggers.panic_trigger.is_alerting)
+        samples.add("is_threshold", [], triggers.threshold_trigger.is_alerting)
 
+        self._tick_collector.update(samples)
         self._last_metrics_collect_clock = self._clock()
 
     def measure_tick(self) -> ContextManager[None]:
         return self.tick_duration.time()
 
     def _collect_fan_metrics(
-        self, fans: Fans, fan_name: FanName, pwm_fan_norm: PWMFanNorm
+        self,
+        samples: "_TickSamples",
+        fans: Fans,
+        fan_name: FanName,
+        pwm_fan_norm: PWMFanNorm,
     ):
-        self.fan_pwm_line_start.labels(fan_name).set(pwm_fan_norm.pwm_line_start)
-        self.fan_pwm_line_end.labels(fan_name).set(pwm_fan_norm.pwm_line_end)
-        self._collect_any_fan_metrics(fans, fan_name, pwm_fan_norm)
+        labels = [fan_name]
+        samples.add("fan_pwm_line_start", labels, pwm_fan_norm.pwm_line_start)
+        samples.add("fan_pwm_line_end", labels, pwm_fan_norm.pwm_line_end)
+        self._collect_any_fan_metrics(samples, fans, fan_name, pwm_fan_norm)
 
     def _collect_readonly_fan_metrics(
-        self, fans: Fans, fan_name: ReadonlyFanName, pwm_fan_norm: ReadonlyPWMFanNorm
+        self,
+        samples: "_TickSamples",
+        fans: Fans,
+        fan_name: ReadonlyFanName,
+        pwm_fan_norm: ReadonlyPWMFanNorm,
     ):
-        self._collect_any_fan_metrics(fans, fan_name, pwm_fan_norm)
+        self._collect_any_fan_metrics(samples, fans, fan_name, pwm_fan_norm)
 
     def _collect_any_fan_metrics(
         self,
+        samples: "_TickSamples",
         fans: Fans,
         fan_name: AnyFanName,
         pwm_fan_norm: Union[PWMFanNorm, ReadonlyPWMFanNorm],
     ):
-        self.fan_is_stopped.labels(fan_name).set(fans.is_fan_stopped(fan_name))
-        self.fan_is_failing.labels(fan_name).set(fans.is_fan_failing(fan_name))
+        labels = [fan_name]
+        samples.add("fan_is_stopped", labels, fans.is_fan_stopped(fan_name))
+        samples.add("fan_is_failing", labels, fans.is_fan_failing(fan_name))
         try:
-            self.fan_rpm.labels(fan_name).set(pwm_fan_norm.get_speed())
-            self.fan_pwm.labels(fan_name).set(none_to_nan(pwm_fan_norm.get_raw()))
-            self.fan_pwm_normalized.labels(fan_name).set(
-                none_to_nan(pwm_fan_norm.get())
-            )
+            rpm: float = pwm_fan_norm.get_speed()
+            pwm = none_to_nan(pwm_fan_norm.get_raw())
+            pwm_normalized = none_to_nan(pwm_fan_norm.get())
         except Exception:
             logger.warning(
                 "Failed to collect metrics for fan %s", fan_name, exc_info=True
             )
-            self.fan_rpm.labels(fan_name).set(none_to_nan(None))
-            self.fan_pwm.labels(fan_name).set(none_to_nan(None))
-            self.fan_pwm_normalized.labels(fan_name).set(none_to_nan(None))
+            rpm = pwm = pwm_normalized = none_to_nan(None)
+        samples.add("fan_rpm", labels, rpm)
+        samples.add("fan_pwm", labels, pwm)
+        samples.add("fan_pwm_normalized", labels, pwm_normalized)
 
     def _clock(self):
         return default_timer()
@@ -379,6 +284,159 @@ def none_to_nan(v: Optional[float]) -> float:
     return v
 
 
+class _GaugeSpec(NamedTuple):
+    name: str
+    documentation: str
+    labelnames: Sequence[str]
+
+
+_TICK_GAUGES = (
+    # Temps:
+    _GaugeSpec(
+        "temperature_is_failing",
+        "The temperature sensor is failing (it isn't returning any data)",
+        ["temp_name"],
+    ),
+    _GaugeSpec(
+        "temperature_current",
+        "The current (filtered) temperature value (in Celsius) "
+        "from a temperature sensor",
+        ["temp_name"],
+    ),
+    _GaugeSpec(
+        "temperature_min",
+        "The min temperature value (in Celsius) for a temperature sensor",
+        ["temp_name"],
+    ),
+    _GaugeSpec(
+        "temperature_max",
+        "The max temperature value (in Celsius) for a temperature sensor",
+        ["temp_name"],
+    ),
+    _GaugeSpec(
+        "temperature_panic",
+        "The panic temperature value (in Celsius) for a temperature sensor",
+        ["temp_name"],
+    ),
+    _GaugeSpec(
+        "temperature_threshold",
+        "The threshold temperature value (in Celsius) for a temperature sensor",
+        ["temp_name"],
+    ),
+    _GaugeSpec(
+        "temperature_is_panic",
+        "Is panic temperature reached for a temperature sensor",
+        ["temp_name"],
+    ),
+    _GaugeSpec(
+        "temperature_is_threshold",
+        "Is threshold temperature reached for a temperature sensor",
+        ["temp_name"],
+    ),
+    _GaugeSpec(
+        "temperature_current_raw",
+        "The current (unfiltered) temperature value (in Celsius) "
+        "from a temperature sensor",
+        ["temp_name"],
+    ),
+    # Fans:
+    _GaugeSpec("fan_rpm", "Fan speed (in RPM) as reported by the fan", ["fan_name"]),
+    _GaugeSpec("fan_pwm", "Current fan's PWM value (from 0 to 255)", ["fan_name"]),
+    _GaugeSpec(
+        "fan_pwm_normalized",
+        "Current fan's normalized PWM value (from 0.0 to 1.0, within "
+        "the `fan_pwm_line_start` and `fan_pwm_line_end` interval)",
+        ["fan_name"],
+    ),
+    _GaugeSpec(
+        "fan_pwm_line_start",
+        "PWM value where a linear correlation with RPM starts for the fan",
+        ["fan_name"],
+    ),
+    _GaugeSpec(
+        "fan_pwm_line_end",
+        "PWM value where a linear correlation with RPM ends for the fan",
+        ["fan_name"],
+    ),
+    _GaugeSpec(
+        "fan_is_stopped",
+        "Is PWM fan stopped because the corresponding temperatures are already low",
+        ["fan_name"],
+    ),
+    _GaugeSpec(
+        "fan_is_failing",
+        "Is PWM fan marked as failing (e.g. because it has jammed)",
+        ["fan_name"],
+    ),
+    # Arduino boards:
+    _GaugeSpec(
+        "arduino_is_connected",
+        "Is Arduino board connected via Serial",
+        ["arduino_name"],
+    ),
+    _GaugeSpec(
+        "arduino_status_age_seconds",
+        "Seconds since the last `status` message from "
+        "the Arduino board (measured at the latest tick)",
+        ["arduino_name"],
+    ),
+    # Others:
+    _GaugeSpec("is_panic", "Is in panic mode", []),
+    _GaugeSpec("is_threshold", "Is in threshold mode", []),
+)
+
+
+class _TickSamples:
+    """Gauge sample values gathered during a single tick."""
+
+    def __init__(self) -> None:
+        self._samples: Dict[str, List[Tuple[Sequence[str], float]]] = {
+            spec.name: [] for spec in _TICK_GAUGES
+        }
+
+    def add(self, name: str, labels: Sequence[str], value: float) -> None:
+        self._samples[name].append((labels, float(value)))
+
+    def get(self, name: str) -> Sequence[Tuple[Sequence[str], float]]:
+        return self._samples[name]
+
+
+class _TickCollector:
+    """prometheus_client collector exposing the samples of the latest tick."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        samples = _TickSamples()
+        # Unlabelled gauges are exported as 0 until the first tick,
+        # as a `prom.Gauge` would have done.
+        samples.add("is_panic", [], 0)
+        samples.add("is_threshold", [], 0)
+        self.update(samples)
+
+    def update(self, samples: _TickSamples) -> None:
+        # The metric families are built once per tick and then reused by
+        # all of the scrapes until the next tick. The rendered output itself
+        # is not cached, because the rest of the registry (e.g.
+        # `last_metrics_tick_seconds_ago`) changes between the scrapes.
+        families = list(self.describe())
+        for family in families:
+            for labels, value in samples.get(family.name):
+                family.add_metric(labels, value)
+        with self._lock:
+            self._families = families
+
+    def describe(self) -> Iterator["GaugeMetricFamily"]:
+        for spec in _TICK_GAUGES:
+            yield GaugeMetricFamily(
+                spec.name, spec.documentation, labels=spec.labelnames
+            )
+
+    def collect(self) -> Iterator["GaugeMetricFamily"]:
+        with self._lock:
+            families = self._families
+        return iter(families)
+
+
 class _ThreadingSimpleServer(ThreadingMixIn, HTTPServer):
     """Thread per request HTTP server."""
 
@@ -25,7 +25,7 @@ class LinuxFanSpeed(BaseFanSpeed):
         return cls(FanInputDevice(section["fan_input"]))
 
     def get_speed(self) -> FanValue:
-        return FanValue(int(self._fan_input.read_text()))
+        return FanValue(int(self._fan_input.read_bytes()))
 
 
 class LinuxFanPWMRead(BaseFanPWMRead):
@@ -42,7 +42,7 @@ class LinuxFanPWMRead(BaseFanPWMRead):
         return cls(PWMDevice(section["pwm"]))
 
     def get(self) -> PWMValue:
-        return PWMValue(int(self._pwm.read_text()))
+        return PWMValue(int(self._pwm.read_bytes()))
 
 
 class LinuxFanPWMWrite(BaseFanPWMWrite):
@@ -84,7 +84,7 @@ class LinuxFanPWMWrite(BaseFanPWMWrite):
 
         if (
             self._pwm_enable.read_text().strip() == "1"
-            and int(self._pwm.read_text()) >= self.read_cls.max_pwm
+            and int(self._pwm.read_bytes()) >= self.read_cls.max_pwm
         ):
             return
 
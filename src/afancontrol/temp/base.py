@@ -13,6 +13,27 @@ class TempStatus(NamedTuple):
     is_panic: bool
     is_threshold: bool
 
+    @classmethod
+    def from_temp(
+        cls,
+        temp: TempCelsius,
+        min_t: TempCelsius,
+        max_t: TempCelsius,
+        *,
+        panic: Optional[TempCelsius],
+        threshold: Optional[TempCelsius]
+    ) -> "TempStatus":
+        # `_make` is already taken by namedtuple (and used by `_replace`).
+        return cls(
+            temp,
+            min_t,
+            max_t,
+            panic,
+            threshold,
+            panic is not None and temp >= panic,
+            threshold is not None and temp >= threshold,
+        )
+
 
 class Temp(abc.ABC):
     def __init__(
@@ -29,14 +50,8 @@ class Temp(abc.ABC):
                 "Min temperature must be less than max. %s < %s" % (min_t, max_t)
             )
 
-        return TempStatus(
-            temp=temp,
-            min=min_t,
-            max=max_t,
-            panic=self._panic,
-            threshold=self._threshold,
-            is_panic=self._panic is not None and temp >= self._panic,
-            is_threshold=self._threshold is not None and temp >= self._threshold,
+        return TempStatus.from_temp(
+            temp, min_t, max_t, panic=self._panic, threshold=self._threshold
         )
 
     @abc.abstractmethod
@@ -5,6 +5,9 @@ from typing import Optional, Tuple
 from afancontrol.configparser import ConfigParserSection, expand_glob
 from afancontrol.temp.base import Temp, TempCelsius
 
+# sysfs attributes are at most a page long.
+_SYSFS_ATTR_MAX_SIZE = 4096
+
 
 class FileTemp(Temp):
     def __init__(
@@ -96,4 +99,8 @@ class FileTemp(Temp):
         return max_t
 
     def _read_temp_from_path(self, path: Path) -> TempCelsius:
-        return TempCelsius(int(path.read_text().strip()) / 1000)
+        # sysfs attributes cannot be mmap'ed, but they can be read with
+        # a single unbuffered `read()` call, which avoids the text I/O stack
+        # of `Path.read_text()`. `int()` skips the trailing newline by itself.
+        with path.open("rb", buffering=0) as f:
+            return TempCelsius(int(f.read(_SYSFS_ATTR_MAX_SIZE)) / 1000)
@@ -1,19 +1,26 @@
+import functools
+import re
 from typing import Optional, Tuple
 
 from afancontrol.configparser import ConfigParserSection
 from afancontrol.exec import Programs, exec_shell_command
 from afancontrol.temp.base import Temp, TempCelsius
 
+# A line of `hddtemp -n` output holding a temperature value. Other lines
+# are error messages, like "drive supported, but it doesn't have
+# a temperature sensor."
+_TEMP_LINE_RE = re.compile(r"[-+]?(?:\d+\.?\d*|\.\d+)")
 
-def _is_float(s: str) -> bool:
-    if not s:
-        return False
-    try:
-        float(s)
-    except (ValueError, TypeError):
-        return False
-    else:
-        return True
+
+# The output of hddtemp usually stays the same between the ticks,
+# so there's no need to parse it again each time.
+@functools.lru_cache(maxsize=8)
+def _parse_hddtemp_output(output: str) -> TempCelsius:
+    lines = (line.strip() for line in output.split("\n"))
+    temps = [float(line) for line in lines if _TEMP_LINE_RE.fullmatch(line)]
+    if not temps:
+        raise RuntimeError("hddtemp returned empty list of valid temperature values")
+    return TempCelsius(max(temps))
 
 
 class HDDTemp(Temp):
@@ -78,16 +85,7 @@ class HDDTemp(Temp):
         )
 
     def _get_temp(self) -> Tuple[TempCelsius, TempCelsius, TempCelsius]:
-        temps = [
-            float(line.strip())
-            for line in self._call_hddtemp().split("\n")
-            if _is_float(line.strip())
-        ]
-        if not temps:
-            raise RuntimeError(
-                "hddtemp returned empty list of valid temperature values"
-            )
-        temp = TempCelsius(max(temps))
+        temp = _parse_hddtemp_output(self._call_hddtemp())
         return temp, self._get_min(), self._get_max()
 
     def _get_min(self) -> TempCelsius:
@@ -33,8 +33,12 @@ class Temps:
         try:
             for filtered_temp in self.temps.values():
                 self._stack.enter_context(filtered_temp.filter)
+            # A worker per sensor, so a slow sensor (like hddtemp) never
+            # delays polling of the others within a tick.
             self._executor = self._stack.enter_context(
-                concurrent.futures.ThreadPoolExecutor()
+                concurrent.futures.ThreadPoolExecutor(
+                    max_workers=max(1, len(self.temps))
+                )
             )
         except Exception:
             self._stack.close()
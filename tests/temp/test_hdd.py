@@ -52,6 +52,32 @@ def test_hddtemp_many(hddtemp_output_many):
         print(repr(t))
 
 
+@pytest.mark.parametrize(
+    "output, expected_temp",
+    [
+        ("-5\n-2\n", -2.0),
+        ("37.5\n36\n", 37.5),
+        ("38\r\n36\r\n", 38.0),
+        ("+38\n36\n", 38.0),
+        ("38.\n36\n", 38.0),
+    ],
+    ids=["negative", "decimal", "crlf", "plus_sign", "trailing_dot"],
+)
+def test_hddtemp_number_formats(output, expected_temp):
+    with patch.object(HDDTemp, "_call_hddtemp") as mock_call_hddtemp:
+        mock_call_hddtemp.return_value = output
+        t = HDDTemp(
+            disk_path="/dev/sd?",
+            min=TempCelsius(38.0),
+            max=TempCelsius(45.0),
+            panic=TempCelsius(50.0),
+            threshold=None,
+            hddtemp_bin="testbin",
+        )
+
+        assert t.get().temp == TempCelsius(expected_temp)
+
+
 def test_hddtemp_bad(hddtemp_output_bad):
     with patch.object(HDDTemp, "_call_hddtemp") as mock_call_hddtemp:
         mock_call_hddtemp.return_value = hddtemp_output_bad
@@ -1,5 +1,6 @@
 from pathlib import Path
-from unittest.mock import Mock
+from types import SimpleNamespace
+from typing import cast
 
 import pytest
 
@@ -41,104 +42,102 @@ from afancontrol.pwmfannorm import PWMFanNorm, ReadonlyPWMFanNorm
 from afancontrol.temp import FileTemp, HDDTemp, TempCelsius
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def pkg_conf():
     return Path(__file__).parents[1] / "pkg" / "afancontrol.conf"
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def example_conf():
     return Path(__file__).parents[0] / "data" / "afancontrol-example.conf"
 
 
-def path_from_str(contents: str) -> Path:
-    p = Mock(spec=Path)
-    p.read_text.return_value = contents
-    return p
+_EMPTY_DAEMON_CLI_CONFIG = DaemonCLIConfig(
+    pidfile=None, logfile=None, exporter_listen_host=None
+)
 
 
-@pytest.mark.skipif(not pyserial_available, reason="pyserial is not installed")
-def test_pkg_conf(pkg_conf: Path):
-    daemon_cli_config = DaemonCLIConfig(
-        pidfile=None, logfile=None, exporter_listen_host=None
-    )
-
-    parsed = parse_config(pkg_conf, daemon_cli_config)
-    assert parsed == ParsedConfig(
-        arduino_connections={},
-        daemon=DaemonConfig(
-            pidfile="/run/afancontrol.pid",
-            logfile="/var/log/afancontrol.log",
-            interval=5,
-            exporter_listen_host=None,
-        ),
-        report_cmd=(
-            'printf "Subject: %s\nTo: %s\n\n%b" '
-            '"afancontrol daemon report: %REASON%" root "%MESSAGE%" | sendmail -t'
+def path_from_str(contents: str) -> Path:
+    # `parse_config` only calls `read_text()`, so there's no need
+    # for a full-blown `Mock(spec=Path)`.
+    return cast(Path, SimpleNamespace(read_text=lambda **kwargs: contents))
+
+
+_EXPECTED_PKG_CONF = ParsedConfig(
+    arduino_connections={},
+    daemon=DaemonConfig(
+        pidfile="/run/afancontrol.pid",
+        logfile="/var/log/afancontrol.log",
+        interval=5,
+        exporter_listen_host=None,
+    ),
+    report_cmd=(
+        'printf "Subject: %s\nTo: %s\n\n%b" '
+        '"afancontrol daemon report: %REASON%" root "%MESSAGE%" | sendmail -t'
+    ),
+    triggers=TriggerConfig(
+        global_commands=Actions(
+            panic=AlertCommands(enter_cmd=None, leave_cmd=None),
+            threshold=AlertCommands(enter_cmd=None, leave_cmd=None),
         ),
-        triggers=TriggerConfig(
-            global_commands=Actions(
+        temp_commands={
+            TempName("mobo"): Actions(
                 panic=AlertCommands(enter_cmd=None, leave_cmd=None),
                 threshold=AlertCommands(enter_cmd=None, leave_cmd=None),
-            ),
-            temp_commands={
-                TempName("mobo"): Actions(
-                    panic=AlertCommands(enter_cmd=None, leave_cmd=None),
-                    threshold=AlertCommands(enter_cmd=None, leave_cmd=None),
-                )
-            },
-        ),
-        fans={
-            FanName("hdd"): PWMFanNorm(
-                fan_speed=LinuxFanSpeed(
-                    FanInputDevice("/sys/class/hwmon/hwmon0/device/fan2_input")
-                ),
-                pwm_read=LinuxFanPWMRead(
-                    PWMDevice("/sys/class/hwmon/hwmon0/device/pwm2")
-                ),
-                pwm_write=LinuxFanPWMWrite(
-                    PWMDevice("/sys/class/hwmon/hwmon0/device/pwm2")
-                ),
-                pwm_line_start=PWMValue(100),
-                pwm_line_end=PWMValue(240),
-                never_stop=False,
             )
         },
-        readonly_fans={
-            ReadonlyFanName("cpu"): ReadonlyPWMFanNorm(
-                fan_speed=LinuxFanSpeed(
-                    FanInputDevice("/sys/class/hwmon/hwmon0/device/fan1_input")
-                ),
+    ),
+    fans={
+        FanName("hdd"): PWMFanNorm(
+            fan_speed=LinuxFanSpeed(
+                FanInputDevice("/sys/class/hwmon/hwmon0/device/fan2_input")
             ),
-        },
-        temps={
-            TempName("mobo"): FilteredTemp(
-                temp=FileTemp(
-                    "/sys/class/hwmon/hwmon0/device/temp1_input",
-                    min=TempCelsius(30.0),
-                    max=TempCelsius(40.0),
-                    panic=None,
-                    threshold=None,
-                ),
-                filter=MovingMedianFilter(window_size=3),
-            )
-        },
-        mappings={
-            MappingName("1"): FansTempsRelation(
-                temps=[TempName("mobo")],
-                fans=[FanSpeedModifier(fan=FanName("hdd"), modifier=0.6)],
-            )
-        },
-    )
+            pwm_read=LinuxFanPWMRead(PWMDevice("/sys/class/hwmon/hwmon0/device/pwm2")),
+            pwm_write=LinuxFanPWMWrite(
+                PWMDevice("/sys/class/hwmon/hwmon0/device/pwm2")
+            ),
+            pwm_line_start=PWMValue(100),
+            pwm_line_end=PWMValue(240),
+            never_stop=False,
+        )
+    },
+    readonly_fans={
+        ReadonlyFanName("cpu"): ReadonlyPWMFanNorm(
+            fan_speed=LinuxFanSpeed(
+                FanInputDevice("/sys/class/hwmon/hwmon0/device/fan1_input")
+            ),
+        ),
+    },
+    temps={
+        TempName("mobo"): FilteredTemp(
+            temp=FileTemp(
+                "/sys/class/hwmon/hwmon0/device/temp1_input",
+                min=TempCelsius(30.0),
+                max=TempCelsius(40.0),
+                panic=None,
+                threshold=None,
+            ),
+            filter=MovingMedianFilter(window_size=3),
+        )
+    },
+    mappings={
+        MappingName("1"): FansTempsRelation(
+            temps=[TempName("mobo")],
+            fans=[FanSpeedModifier(fan=FanName("hdd"), modifier=0.6)],
+        )
+    },
+)
 
 
 @pytest.mark.skipif(not pyserial_available, reason="pyserial is not installed")
-def test_example_conf(example_conf: Path):
-    daemon_cli_config = DaemonCLIConfig(
-        pidfile=None, logfile=None, exporter_listen_host=None
-    )
+def test_pkg_conf(pkg_conf: Path):
+    parsed = parse_config(pkg_conf, _EMPTY_DAEMON_CLI_CONFIG)
+    assert parsed == _EXPECTED_PKG_CONF
+
 
-    parsed = parse_config(example_conf, daemon_cli_config)
+@pytest.mark.skipif(not pyserial_available, reason="pyserial is not installed")
+def test_example_conf(example_conf: Path):
+    parsed = parse_config(example_conf, _EMPTY_DAEMON_CLI_CONFIG)
     assert parsed == ParsedConfig(
         arduino_connections={
             ArduinoName("mymicro"): ArduinoConnection(
@@ -277,12 +276,116 @@ def test_example_conf(example_conf: Path):
     )
 
 
-def test_minimal_config() -> None:
-    daemon_cli_config = DaemonCLIConfig(
-        pidfile=None, logfile=None, exporter_listen_host=None
-    )
+_EXPECTED_MINIMAL = ParsedConfig(
+    arduino_connections={},
+    daemon=DaemonConfig(
+        pidfile="/run/afancontrol.pid",
+        logfile=None,
+        exporter_listen_host=None,
+        interval=5,
+    ),
+    report_cmd=(
+        'printf "Subject: %s\nTo: %s\n\n%b" '
+        '"afancontrol daemon report: %REASON%" root "%MESSAGE%" | sendmail -t'
+    ),
+    triggers=TriggerConfig(
+        global_commands=Actions(
+            panic=AlertCommands(enter_cmd=None, leave_cmd=None),
+            threshold=AlertCommands(enter_cmd=None, leave_cmd=None),
+        ),
+        temp_commands={
+            TempName("mobo"): Actions(
+                panic=AlertCommands(enter_cmd=None, leave_cmd=None),
+                threshold=AlertCommands(enter_cmd=None, leave_cmd=None),
+            )
+        },
+    ),
+    fans={
+        FanName("case"): PWMFanNorm(
+            fan_speed=LinuxFanSpeed(
+                FanInputDevice("/sys/class/hwmon/hwmon0/device/fan2_input")
+            ),
+            pwm_read=LinuxFanPWMRead(PWMDevice("/sys/class/hwmon/hwmon0/device/pwm2")),
+            pwm_write=LinuxFanPWMWrite(
+                PWMDevice("/sys/class/hwmon/hwmon0/device/pwm2")
+            ),
+            pwm_line_start=PWMValue(100),
+            pwm_line_end=PWMValue(240),
+            never_stop=True,
+        )
+    },
+    readonly_fans={},
+    temps={
+        TempName("mobo"): FilteredTemp(
+            temp=FileTemp(
+                "/sys/class/hwmon/hwmon0/device/temp1_input",
+                min=None,
+                max=None,
+                panic=None,
+                threshold=None,
+            ),
+            filter=NullFilter(),
+        )
+    },
+    mappings={
+        MappingName("1"): FansTempsRelation(
+            temps=[TempName("mobo")],
+            fans=[FanSpeedModifier(fan=FanName("case"), modifier=0.6)],
+        )
+    },
+)
 
-    config = """
+
+_EXPECTED_READONLY = ParsedConfig(
+    arduino_connections={},
+    daemon=DaemonConfig(
+        pidfile="/run/afancontrol.pid",
+        logfile=None,
+        exporter_listen_host=None,
+        interval=5,
+    ),
+    report_cmd=(
+        'printf "Subject: %s\nTo: %s\n\n%b" '
+        '"afancontrol daemon report: %REASON%" root "%MESSAGE%" | sendmail -t'
+    ),
+    triggers=TriggerConfig(
+        global_commands=Actions(
+            panic=AlertCommands(enter_cmd=None, leave_cmd=None),
+            threshold=AlertCommands(enter_cmd=None, leave_cmd=None),
+        ),
+        temp_commands={
+            TempName("mobo"): Actions(
+                panic=AlertCommands(enter_cmd=None, leave_cmd=None),
+                threshold=AlertCommands(enter_cmd=None, leave_cmd=None),
+            )
+        },
+    ),
+    fans={},
+    readonly_fans={
+        ReadonlyFanName("cpu"): ReadonlyPWMFanNorm(
+            fan_speed=LinuxFanSpeed(
+                FanInputDevice("/sys/class/hwmon/hwmon0/device/fan1_input")
+            ),
+            pwm_read=LinuxFanPWMRead(PWMDevice("/sys/class/hwmon/hwmon0/device/pwm1")),
+        )
+    },
+    temps={
+        TempName("mobo"): FilteredTemp(
+            temp=FileTemp(
+                "/sys/class/hwmon/hwmon0/device/temp1_input",
+                min=None,
+                max=None,
+                panic=None,
+                threshold=None,
+            ),
+            filter=NullFilter(),
+        )
+    },
+    mappings={},
+)
+
+
+_MINIMAL_CONFIG = """
 [daemon]
 
 [actions]
@@ -299,75 +402,8 @@ fan_input = /sys/class/hwmon/hwmon0/device/fan2_input
 fans = case*0.6,
 temps = mobo
 """
-    parsed = parse_config(path_from_str(config), daemon_cli_config)
-    assert parsed == ParsedConfig(
-        arduino_connections={},
-        daemon=DaemonConfig(
-            pidfile="/run/afancontrol.pid",
-            logfile=None,
-            exporter_listen_host=None,
-            interval=5,
-        ),
-        report_cmd=(
-            'printf "Subject: %s\nTo: %s\n\n%b" '
-            '"afancontrol daemon report: %REASON%" root "%MESSAGE%" | sendmail -t'
-        ),
-        triggers=TriggerConfig(
-            global_commands=Actions(
-                panic=AlertCommands(enter_cmd=None, leave_cmd=None),
-                threshold=AlertCommands(enter_cmd=None, leave_cmd=None),
-            ),
-            temp_commands={
-                TempName("mobo"): Actions(
-                    panic=AlertCommands(enter_cmd=None, leave_cmd=None),
-                    threshold=AlertCommands(enter_cmd=None, leave_cmd=None),
-                )
-            },
-        ),
-        fans={
-            FanName("case"): PWMFanNorm(
-                fan_speed=LinuxFanSpeed(
-                    FanInputDevice("/sys/class/hwmon/hwmon0/device/fan2_input")
-                ),
-                pwm_read=LinuxFanPWMRead(
-                    PWMDevice("/sys/class/hwmon/hwmon0/device/pwm2")
-                ),
-                pwm_write=LinuxFanPWMWrite(
-                    PWMDevice("/sys/class/hwmon/hwmon0/device/pwm2")
-                ),
-                pwm_line_start=PWMValue(100),
-                pwm_line_end=PWMValue(240),
-                never_stop=True,
-            )
-        },
-        readonly_fans={},
-        temps={
-            TempName("mobo"): FilteredTemp(
-                temp=FileTemp(
-                    "/sys/class/hwmon/hwmon0/device/temp1_input",
-                    min=None,
-                    max=None,
-                    panic=None,
-                    threshold=None,
-                ),
-                filter=NullFilter(),
-            )
-        },
-        mappings={
-            MappingName("1"): FansTempsRelation(
-                temps=[TempName("mobo")],
-                fans=[FanSpeedModifier(fan=FanName("case"), modifier=0.6)],
-            )
-        },
-    )
-
 
-def test_readonly_config() -> None:
-    daemon_cli_config = DaemonCLIConfig(
-        pidfile=None, logfile=None, exporter_listen_host=None
-    )
-
-    config = """
+_READONLY_CONFIG = """
 [daemon]
 
 [actions]
@@ -380,63 +416,33 @@ path = /sys/class/hwmon/hwmon0/device/temp1_input
 pwm = /sys/class/hwmon/hwmon0/device/pwm1
 fan_input = /sys/class/hwmon/hwmon0/device/fan1_input
 """
-    parsed = parse_config(path_from_str(config), daemon_cli_config)
-    assert parsed == ParsedConfig(
-        arduino_connections={},
-        daemon=DaemonConfig(
-            pidfile="/run/afancontrol.pid",
-            logfile=None,
-            exporter_listen_host=None,
-            interval=5,
-        ),
-        report_cmd=(
-            'printf "Subject: %s\nTo: %s\n\n%b" '
-            '"afancontrol daemon report: %REASON%" root "%MESSAGE%" | sendmail -t'
-        ),
-        triggers=TriggerConfig(
-            global_commands=Actions(
-                panic=AlertCommands(enter_cmd=None, leave_cmd=None),
-                threshold=AlertCommands(enter_cmd=None, leave_cmd=None),
-            ),
-            temp_commands={
-                TempName("mobo"): Actions(
-                    panic=AlertCommands(enter_cmd=None, leave_cmd=None),
-                    threshold=AlertCommands(enter_cmd=None, leave_cmd=None),
-                )
-            },
-        ),
-        fans={},
-        readonly_fans={
-            ReadonlyFanName("cpu"): ReadonlyPWMFanNorm(
-                fan_speed=LinuxFanSpeed(
-                    FanInputDevice("/sys/class/hwmon/hwmon0/device/fan1_input")
-                ),
-                pwm_read=LinuxFanPWMRead(
-                    PWMDevice("/sys/class/hwmon/hwmon0/device/pwm1")
-                ),
-            )
-        },
-        temps={
-            TempName("mobo"): FilteredTemp(
-                temp=FileTemp(
-                    "/sys/class/hwmon/hwmon0/device/temp1_input",
-                    min=None,
-                    max=None,
-                    panic=None,
-                    threshold=None,
-                ),
-                filter=NullFilter(),
-            )
-        },
-        mappings={},
-    )
 
 
-def test_multiline_mapping():
-    daemon_cli_config = DaemonCLIConfig(
-        pidfile=None, logfile=None, exporter_listen_host=None
+@pytest.mark.parametrize(
+    "config, expected",
+    [
+        (_MINIMAL_CONFIG, _EXPECTED_MINIMAL),
+        (_READONLY_CONFIG, _EXPECTED_READONLY),
+    ],
+    ids=["minimal", "readonly"],
+)
+def test_parse_config(config: str, expected: ParsedConfig) -> None:
+    parsed = parse_config(path_from_str(config), _EMPTY_DAEMON_CLI_CONFIG)
+    assert parsed == expected
+
+
+_EXPECTED_MULTILINE_MAPPING = {
+    MappingName("1"): FansTempsRelation(
+        temps=[TempName("mobo"), TempName("cpu")],
+        fans=[
+            FanSpeedModifier(fan=FanName("case"), modifier=0.6),
+            FanSpeedModifier(fan=FanName("hdd"), modifier=1.0),
+        ],
     )
+}
 
+
+def test_multiline_mapping():
     config = """
 [daemon]
 
@@ -466,23 +472,11 @@ temps =
     mobo,
     cpu
 """
-    parsed = parse_config(path_from_str(config), daemon_cli_config)
-    assert parsed.mappings == {
-        MappingName("1"): FansTempsRelation(
-            temps=[TempName("mobo"), TempName("cpu")],
-            fans=[
-                FanSpeedModifier(fan=FanName("case"), modifier=0.6),
-                FanSpeedModifier(fan=FanName("hdd"), modifier=1.0),
-            ],
-        )
-    }
+    parsed = parse_config(path_from_str(config), _EMPTY_DAEMON_CLI_CONFIG)
+    assert parsed.mappings == _EXPECTED_MULTILINE_MAPPING
 
 
 def test_extraneous_keys_raises():
-    daemon_cli_config = DaemonCLIConfig(
-        pidfile=None, logfile=None, exporter_listen_host=None
-    )
-
     config = """
 [daemon]
 
@@ -494,5 +488,28 @@ path = /sys/class/hwmon/hwmon0/device/temp1_input
 aa = 55
 """
     with pytest.raises(RuntimeError) as cm:
-        parse_config(path_from_str(config), daemon_cli_config)
+        parse_config(path_from_str(config), _EMPTY_DAEMON_CLI_CONFIG)
     assert str(cm.value) == "Unknown options in the [temp:   mobo] section: {'aa'}"
+
+
+def test_invalid_fan_specification_raises():
+    config = """
+[daemon]
+
+[actions]
+
+[temp:mobo]
+type = file
+path = /sys/class/hwmon/hwmon0/device/temp1_input
+
+[fan: case]
+pwm = /sys/class/hwmon/hwmon0/device/pwm2
+fan_input = /sys/class/hwmon/hwmon0/device/fan2_input
+
+[mapping:1]
+fans = case*0.6*0.5
+temps = mobo
+"""
+    with pytest.raises(RuntimeError) as cm:
+        parse_config(path_from_str(config), _EMPTY_DAEMON_CLI_CONFIG)
+    assert str(cm.value) == "Invalid fan specification 'case*0.6*0.5' in mapping '1'"
@@ -74,6 +74,7 @@ def test_pidfile_not_existing(temp_path):
     with pidfile:
         pidfile.save_pid(42)
         assert "42" == pidpath.read_text()
+        assert not (temp_path / "test.pid.tmp").exists()
 
     assert not pidpath.exists()
 
@@ -95,5 +96,12 @@ def test_signals():
 
     assert False is s.wait_for_term_queued(0.001)
 
+    s.sigterm(None, None)
+    assert True is s.wait_for_term_queued(0)
+
+
+def test_signals_from_another_thread():
+    s = Signals()
+
     threading.Timer(0.01, lambda: s.sigterm(None, None)).start()
-    assert True is s.wait_for_term_queued(1e6)
+    assert True is s.wait_for_term_queued(10)
@@ -1,5 +1,5 @@
 from contextlib import ExitStack
-from typing import Any, Type
+from typing import Any, List, Type
 from unittest.mock import MagicMock, patch
 
 import pytest
@@ -84,6 +84,10 @@ def test_fantest(output_cls: Type[MeasurementsOutput], pwm_step_size: PWMValue):
     )
     fan.pwm_read.min_pwm = 0
     fan.pwm_read.max_pwm = 255
+    # A plain `list.append` doesn't record a `call` object per step
+    # like the MagicMock does.
+    pwm_set_values: List[PWMValue] = []
+    fan.pwm_write.set = pwm_set_values.append
     output = output_cls()
 
     with ExitStack() as stack:
@@ -92,7 +96,7 @@ def test_fantest(output_cls: Type[MeasurementsOutput], pwm_step_size: PWMValue):
 
         run_fantest(fan=fan, pwm_step_size=pwm_step_size, output=output)
 
-        assert fan.pwm_write.set.call_count == (255 // abs(pwm_step_size)) + 1
+        assert len(pwm_set_values) == (255 // abs(pwm_step_size)) + 1
         assert fan.fan_speed.get_speed.call_count == (255 // abs(pwm_step_size))
         assert mocked_sleep.call_count == (255 // abs(pwm_step_size)) + 1
 
@@ -102,4 +106,4 @@ def test_fantest(output_cls: Type[MeasurementsOutput], pwm_step_size: PWMValue):
         else:
             # decrease
             expected_set = [255] + list(range(255, 0, pwm_step_size))
-        assert [pwm for (pwm,), _ in fan.pwm_write.set.call_args_list] == expected_set
+        assert pwm_set_values == expected_set
@@ -42,33 +42,54 @@ def test_single_point(filter):
         assert filter.apply(make_temp_status(42.0)) == make_temp_status(42.0)
 
 
+def make_optional_temp_status(temp):
+    if temp is None:
+        return None
+    return make_temp_status(temp)
+
+
+def assert_filter_steps(filter, steps):
+    with filter:
+        for i, (temp, expected_temp) in enumerate(steps):
+            status = filter.apply(make_optional_temp_status(temp))
+            assert status == make_optional_temp_status(expected_temp), "step %s" % i
+
+
 def test_moving_quantile():
-    f = MovingQuantileFilter(0.8, window_size=10)
-    with f:
-        assert f.apply(make_temp_status(42.0)) == make_temp_status(42.0)
-        assert f.apply(make_temp_status(45.0)) == make_temp_status(45.0)
-        assert f.apply(make_temp_status(47.0)) == make_temp_status(47.0)
-        assert f.apply(make_temp_status(123.0)) == make_temp_status(123.0)
-        assert f.apply(make_temp_status(46.0)) == make_temp_status(123.0)
-        assert f.apply(make_temp_status(49.0)) == make_temp_status(49.0)
-        assert f.apply(make_temp_status(51.0)) == make_temp_status(51.0)
-        assert f.apply(None) == make_temp_status(123.0)
-        assert f.apply(None) is None
-        assert f.apply(make_temp_status(51.0)) is None
-        assert f.apply(make_temp_status(53.0)) is None
+    assert_filter_steps(
+        MovingQuantileFilter(0.8, window_size=10),
+        [
+            # (input, expected output)
+            (42.0, 42.0),
+            (45.0, 45.0),
+            (47.0, 47.0),
+            (123.0, 123.0),
+            (46.0, 123.0),
+            (49.0, 49.0),
+            (51.0, 51.0),
+            (None, 123.0),
+            (None, None),
+            (51.0, None),
+            (53.0, None),
+        ],
+    )
 
 
 def test_moving_median():
-    f = MovingMedianFilter(window_size=3)
-    with f:
-        assert f.apply(make_temp_status(42.0)) == make_temp_status(42.0)
-        assert f.apply(make_temp_status(45.0)) == make_temp_status(45.0)
-        assert f.apply(make_temp_status(47.0)) == make_temp_status(45.0)
-        assert f.apply(make_temp_status(123.0)) == make_temp_status(47.0)
-        assert f.apply(make_temp_status(46.0)) == make_temp_status(47.0)
-        assert f.apply(make_temp_status(49.0)) == make_temp_status(49.0)
-        assert f.apply(make_temp_status(51.0)) == make_temp_status(49.0)
-        assert f.apply(None) == make_temp_status(51.0)
-        assert f.apply(None) is None
-        assert f.apply(make_temp_status(51.0)) is None
-        assert f.apply(make_temp_status(53.0)) == make_temp_status(53.0)
+    assert_filter_steps(
+        MovingMedianFilter(window_size=3),
+        [
+            # (input, expected output)
+            (42.0, 42.0),
+            (45.0, 45.0),
+            (47.0, 45.0),
+            (123.0, 47.0),
+            (46.0, 47.0),
+            (49.0, 49.0),
+            (51.0, 49.0),
+            (None, 51.0),
+            (None, None),
+            (51.0, None),
+            (53.0, 53.0),
+        ],
+    )
@@ -19,8 +19,9 @@ from afancontrol.manager import Manager
 from afancontrol.metrics import Metrics
 from afancontrol.pwmfannorm import PWMFanNorm, PWMValueNorm
 from afancontrol.report import Report
-from afancontrol.temp import FileTemp, TempCelsius, TempStatus
+from afancontrol.temp import FileTemp
 from afancontrol.trigger import Triggers
+from tests.test_filters import make_temp_status
 
 
 @pytest.fixture
@@ -83,15 +84,7 @@ def test_manager(report):
     [
         (
             {
-                TempName("cpu"): TempStatus(
-                    min=TempCelsius(30),
-                    max=TempCelsius(50),
-                    temp=TempCelsius((50 - 30) * 0.42 + 30),
-                    panic=None,
-                    threshold=None,
-                    is_panic=False,
-                    is_threshold=False,
-                ),
+                TempName("cpu"): make_temp_status((50 - 30) * 0.42 + 30),
                 TempName("hdd"): None,  # a failing sensor
             },
             {
@@ -103,17 +96,7 @@ def test_manager(report):
             {FanName("rear"): PWMValueNorm(1.0)},
         ),
         (
-            {
-                TempName("cpu"): TempStatus(
-                    min=TempCelsius(30),
-                    max=TempCelsius(50),
-                    temp=TempCelsius((50 - 30) * 0.42 + 30),
-                    panic=None,
-                    threshold=None,
-                    is_panic=False,
-                    is_threshold=False,
-                )
-            },
+            {TempName("cpu"): make_temp_status((50 - 30) * 0.42 + 30)},
             {
                 MappingName("all"): FansTempsRelation(
                     temps=[TempName("cpu")],
@@ -123,17 +106,7 @@ def test_manager(report):
             {FanName("rear"): PWMValueNorm(0.42)},
         ),
         (
-            {
-                TempName("cpu"): TempStatus(
-                    min=TempCelsius(30),
-                    max=TempCelsius(50),
-                    temp=TempCelsius((50 - 30) * 0.42 + 30),
-                    panic=None,
-                    threshold=None,
-                    is_panic=False,
-                    is_threshold=False,
-                )
-            },
+            {TempName("cpu"): make_temp_status((50 - 30) * 0.42 + 30)},
             {
                 MappingName("all"): FansTempsRelation(
                     temps=[TempName("cpu")],
@@ -144,33 +117,9 @@ def test_manager(report):
         ),
         (
             {
-                TempName("cpu"): TempStatus(
-                    min=TempCelsius(30),
-                    max=TempCelsius(50),
-                    temp=TempCelsius((50 - 30) * 0.42 + 30),
-                    panic=None,
-                    threshold=None,
-                    is_panic=False,
-                    is_threshold=False,
-                ),
-                TempName("mobo"): TempStatus(
-                    min=TempCelsius(30),
-                    max=TempCelsius(50),
-                    temp=TempCelsius((50 - 30) * 0.52 + 30),
-                    panic=None,
-                    threshold=None,
-                    is_panic=False,
-                    is_threshold=False,
-                ),
-                TempName("hdd"): TempStatus(
-                    min=TempCelsius(30),
-                    max=TempCelsius(50),
-                    temp=TempCelsius((50 - 30) * 0.12 + 30),
-                    panic=None,
-                    threshold=None,
-                    is_panic=False,
-                    is_threshold=False,
-                ),
+                TempName("cpu"): make_temp_status((50 - 30) * 0.42 + 30),
+                TempName("mobo"): make_temp_status((50 - 30) * 0.52 + 30),
+                TempName("hdd"): make_temp_status((50 - 30) * 0.12 + 30),
             },
             {
                 MappingName("all"): FansTempsRelation(
@@ -182,33 +131,9 @@ def test_manager(report):
         ),
         (
             {
-                TempName("cpu"): TempStatus(
-                    min=TempCelsius(30),
-                    max=TempCelsius(50),
-                    temp=TempCelsius((50 - 30) * 0.42 + 30),
-                    panic=None,
-                    threshold=None,
-                    is_panic=False,
-                    is_threshold=False,
-                ),
-                TempName("mobo"): TempStatus(
-                    min=TempCelsius(30),
-                    max=TempCelsius(50),
-                    temp=TempCelsius((50 - 30) * 0.52 + 30),
-                    panic=None,
-                    threshold=None,
-                    is_panic=False,
-                    is_threshold=False,
-                ),
-                TempName("hdd"): TempStatus(
-                    min=TempCelsius(30),
-                    max=TempCelsius(50),
-                    temp=TempCelsius((50 - 30) * 0.12 + 30),
-                    panic=None,
-                    threshold=None,
-                    is_panic=False,
-                    is_threshold=False,
-                ),
+                TempName("cpu"): make_temp_status((50 - 30) * 0.42 + 30),
+                TempName("mobo"): make_temp_status((50 - 30) * 0.52 + 30),
+                TempName("hdd"): make_temp_status((50 - 30) * 0.12 + 30),
             },
             {
                 MappingName("1"): FansTempsRelation(
@@ -1,4 +1,4 @@
-import random
+import socket
 import types
 from time import sleep
 from unittest.mock import MagicMock
@@ -16,6 +16,13 @@ from afancontrol.temps import ObservedTempStatus
 from afancontrol.trigger import Triggers
 
 
+def get_free_port() -> int:
+    # Let the kernel pick a free port instead of guessing a random one.
+    with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
 @pytest.fixture
 def requests_session():
     # Ignore system proxies, see https://stackoverflow.com/a/28521696
@@ -32,7 +39,7 @@ def test_prometheus_metrics(requests_session):
     mocked_triggers = MagicMock(spec=Triggers)()
     mocked_report = MagicMock(spec=Report)()
 
-    port = random.randint(20000, 50000)
+    port = get_free_port()
     metrics = PrometheusMetrics("127.0.0.1:%s" % port)
     with metrics:
         resp = requests_session.get("http://127.0.0.1:%s/metrics" % port)
@@ -114,43 +121,42 @@ def test_prometheus_metrics(requests_session):
 @pytest.mark.skipif(
     not prometheus_available, reason="prometheus_client is not installed"
 )
-def test_prometheus_faulty_fans_dont_break_metrics_collection(requests_session):
+def test_prometheus_faulty_fans_dont_break_metrics_collection():
+    from prometheus_client import generate_latest
+
     mocked_fan = MagicMock(spec=PWMFanNorm)()
     mocked_triggers = MagicMock(spec=Triggers)()
     mocked_report = MagicMock(spec=Report)()
 
-    port = random.randint(20000, 50000)
-    metrics = PrometheusMetrics("127.0.0.1:%s" % port)
-    with metrics:
-        mocked_triggers.panic_trigger.is_alerting = False
-        mocked_triggers.threshold_trigger.is_alerting = False
-
-        mocked_fan.pwm_line_start = 100
-        mocked_fan.pwm_line_end = 240
-        mocked_fan.get_speed.side_effect = IOError
-        mocked_fan.get_raw.side_effect = IOError
-
-        # Must not raise despite the PWMFan methods raising above:
-        metrics.tick(
-            temps={
-                TempName("failingtemp"): ObservedTempStatus(filtered=None, raw=None)
-            },
-            fans=Fans(
-                fans={FanName("test"): mocked_fan},
-                readonly_fans={},
-                report=mocked_report,
-            ),
-            triggers=mocked_triggers,
-            arduino_connections={},
-        )
-
-        resp = requests_session.get("http://127.0.0.1:%s/metrics" % port)
-        assert resp.status_code == 200
-        assert 'fan_pwm_line_start{fan_name="test"} 100.0' in resp.text
-        assert 'fan_pwm_line_end{fan_name="test"} 240.0' in resp.text
-        assert 'fan_rpm{fan_name="test"} NaN' in resp.text
-        assert 'fan_pwm{fan_name="test"} NaN' in resp.text
-        assert 'fan_pwm_normalized{fan_name="test"} NaN' in resp.text
-        assert 'fan_is_failing{fan_name="test"} 0.0' in resp.text
-        assert "is_panic 0.0" in resp.text
-        assert "is_threshold 0.0" in resp.text
+    # The HTTP server is covered by `test_prometheus_metrics`, here
+    # the registry is rendered in-process without starting it.
+    metrics = PrometheusMetrics("127.0.0.1:0")
+    mocked_triggers.panic_trigger.is_alerting = False
+    mocked_triggers.threshold_trigger.is_alerting = False
+
+    mocked_fan.pwm_line_start = 100
+    mocked_fan.pwm_line_end = 240
+    mocked_fan.get_speed.side_effect = IOError
+    mocked_fan.get_raw.side_effect = IOError
+
+    # Must not raise despite the PWMFan methods raising above:
+    metrics.tick(
+        temps={TempName("failingtemp"): ObservedTempStatus(filtered=None, raw=None)},
+        fans=Fans(
+            fans={FanName("test"): mocked_fan},
+            readonly_fans={},
+            report=mocked_report,
+        ),
+        triggers=mocked_triggers,
+        arduino_connections={},
+    )
+
+    text = generate_latest(metrics.registry).decode()
+    assert 'fan_pwm_line_start{fan_name="test"} 100.0' in text
+    assert 'fan_pwm_line_end{fan_name="test"} 240.0' in text
+    assert 'fan_rpm{fan_name="test"} NaN' in text
+    assert 'fan_pwm{fan_name="test"} NaN' in text
+    assert 'fan_pwm_normalized{fan_name="test"} NaN' in text
+    assert 'fan_is_failing{fan_name="test"} 0.0' in text
+    assert "is_panic 0.0" in text
+    assert "is_threshold 0.0" in text